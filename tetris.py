@@ -81,9 +81,19 @@ SHAPES = {
 
 PIECE_NAMES = list(SHAPES.keys())
 
+# SHAPES frozen into nested tuples, shared read-only by every Piece
+SHAPE_OFFSETS = {name: tuple(tuple(rot) for rot in rots) for name, rots in SHAPES.items()}
+
+# Colour grids are flat row-major bytearrays: 0 is empty, otherwise a piece id
+PIECE_IDS = {name: i for i, name in enumerate(PIECE_NAMES, 1)}
+ID_TO_NAME = {i: name for name, i in PIECE_IDS.items()}
+
 # Scoring (original Nintendo-style)
 LINE_SCORES = {0: 0, 1: 100, 2: 300, 3: 500, 4: 800}
 
+# pygame-ce's Surface.fblits is a faster, non-returning variant of blits
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
 
 # ---------------------------------------------------------------------------
 # Bitmap font — each glyph is a 5-wide x 7-tall pixel pattern
@@ -134,6 +144,34 @@ _GLYPHS: dict[str, list[str]] = {
 }
 
 
+def _blit_many(
+    surface: pygame.Surface,
+    seq: list[tuple[pygame.Surface, tuple[int, int]]],
+) -> None:
+    """Blit every (source, dest) pair in *seq* onto *surface* in one call."""
+    if _HAS_FBLITS:
+        surface.fblits(seq)
+    else:
+        surface.blits(seq, False)
+
+
+_GLYPH_CACHE: dict[tuple[str, int, tuple[int, int, int]], pygame.Surface] = {}
+
+
+def _glyph_surface(ch: str, scale: int, color: tuple[int, int, int]) -> pygame.Surface:
+    """Return glyph *ch* rasterized at *scale* in *color*, rendering it once."""
+    key = (ch, scale, color)
+    surf = _GLYPH_CACHE.get(key)
+    if surf is None:
+        surf = pygame.Surface((5 * scale, 7 * scale), pygame.SRCALPHA).convert_alpha()
+        for row_idx, row_bits in enumerate(_GLYPHS[ch]):
+            for col_idx, bit in enumerate(row_bits):
+                if bit == "1":
+                    surf.fill(color, (col_idx * scale, row_idx * scale, scale, scale))
+        _GLYPH_CACHE[key] = surf
+    return surf
+
+
 def _draw_text(
     surface: pygame.Surface,
     text: str,
@@ -142,20 +180,17 @@ def _draw_text(
     color: tuple[int, int, int],
     scale: int = 2,
 ) -> None:
-    """Render *text* at (x, y) using the bitmap font with given pixel scale."""
-    cursor_x = x
-    for ch in text.upper():
-        glyph = _GLYPHS.get(ch)
-        if glyph is None:
-            cursor_x += 6 * scale  # treat unknown as space
-            continue
-        for row_idx, row_bits in enumerate(glyph):
-            for col_idx, bit in enumerate(row_bits):
-                if bit == "1":
-                    px = cursor_x + col_idx * scale
-                    py = y + row_idx * scale
-                    pygame.draw.rect(surface, color, (px, py, scale, scale))
-        cursor_x += 6 * scale  # 5 px wide + 1 px gap
+    """Render *text* at (x, y) using the bitmap font with given pixel scale.
+
+    The font only has upper-case glyphs, so *text* must already be upper
+    case; lower-case letters render as spaces like any other unknown char.
+    """
+    advance = 6 * scale  # 5 px wide + 1 px gap; unknown chars act as space
+    _blit_many(surface, [
+        (_glyph_surface(ch, scale, color), (x + i * advance, y))
+        for i, ch in enumerate(text)
+        if ch in _GLYPHS
+    ])
 
 
 def _text_width(text: str, scale: int = 2) -> int:
@@ -170,33 +205,31 @@ def _text_width(text: str, scale: int = 2) -> int:
 class Piece:
     """A falling tetromino."""
 
+    __slots__ = ("name", "rotations", "rot_index", "offsets", "color", "row", "col")
+
     def __init__(self, name: str):
         self.name = name
-        self.rotations = SHAPES[name]
+        self.rotations = SHAPE_OFFSETS[name]
         self.rot_index = 0
+        # Offsets of the current rotation, refreshed by rotate()
+        self.offsets = self.rotations[0]
         self.color = PIECE_COLORS[name]
         # Start centred at top
         self.row = 0
         self.col = COLS // 2 - 1
 
-    @property
     def cells(self) -> list[tuple[int, int]]:
         """Return absolute (row, col) positions of each block."""
-        return [
-            (self.row + dr, self.col + dc)
-            for dr, dc in self.rotations[self.rot_index]
-        ]
+        row, col = self.row, self.col
+        return [(row + dr, col + dc) for dr, dc in self.offsets]
 
-    def rotated_cells(self, direction: int = 1) -> list[tuple[int, int]]:
-        """Return cells after rotation without mutating state."""
-        idx = (self.rot_index + direction) % len(self.rotations)
-        return [
-            (self.row + dr, self.col + dc)
-            for dr, dc in self.rotations[idx]
-        ]
+    def rotated_offsets(self, direction: int = 1) -> tuple[tuple[int, int], ...]:
+        """Return offsets after rotation without mutating state."""
+        return self.rotations[(self.rot_index + direction) % len(self.rotations)]
 
     def rotate(self, direction: int = 1) -> None:
         self.rot_index = (self.rot_index + direction) % len(self.rotations)
+        self.offsets = self.rotations[self.rot_index]
 
 
 # ---------------------------------------------------------------------------
@@ -204,35 +237,89 @@ class Piece:
 # ---------------------------------------------------------------------------
 
 
-def empty_board() -> list[list[str | None]]:
-    return [[None] * COLS for _ in range(ROWS)]
+# Row bitmask with every column occupied
+FULL_ROW = (1 << COLS) - 1
 
 
-def is_valid(board: list[list[str | None]], cells: list[tuple[int, int]]) -> bool:
-    for r, c in cells:
-        if r < 0 or r >= ROWS or c < 0 or c >= COLS:
-            return False
-        if board[r][c] is not None:
-            return False
+def empty_board() -> list[int]:
+    """Return an empty occupancy bitboard: bit c of board[r] marks (r, c)."""
+    return [0] * ROWS
+
+
+def empty_colors() -> bytearray:
+    """Return an empty colour grid: row-major piece ids, 0 for empty."""
+    return bytearray(ROWS * COLS)
+
+
+def is_valid_at(board: list[int], row: int, col: int, offsets: tuple[tuple[int, int], ...]) -> bool:
+    """Return whether a shape's *offsets* placed at (row, col) fit on the board."""
+    # Every tetromino has exactly four cells, so the loop is unrolled
+    (dr0, dc0), (dr1, dc1), (dr2, dc2), (dr3, dc3) = offsets
+    r, c = row + dr0, col + dc0
+    if not (0 <= r < ROWS and 0 <= c < COLS) or board[r] >> c & 1:
+        return False
+    r, c = row + dr1, col + dc1
+    if not (0 <= r < ROWS and 0 <= c < COLS) or board[r] >> c & 1:
+        return False
+    r, c = row + dr2, col + dc2
+    if not (0 <= r < ROWS and 0 <= c < COLS) or board[r] >> c & 1:
+        return False
+    r, c = row + dr3, col + dc3
+    if not (0 <= r < ROWS and 0 <= c < COLS) or board[r] >> c & 1:
+        return False
     return True
 
 
-def lock_piece(board: list[list[str | None]], piece: Piece) -> None:
-    for r, c in piece.cells:
+def lock_piece(board: list[int], colors: bytearray, piece: Piece) -> None:
+    piece_id = PIECE_IDS[piece.name]
+    for r, c in piece.cells():
         if 0 <= r < ROWS and 0 <= c < COLS:
-            board[r][c] = piece.name
+            board[r] |= 1 << c
+            colors[r * COLS + c] = piece_id
 
 
-def clear_lines(board: list[list[str | None]]) -> int:
-    cleared = 0
-    r = ROWS - 1
-    while r >= 0:
-        if all(cell is not None for cell in board[r]):
-            del board[r]
-            board.insert(0, [None] * COLS)
-            cleared += 1
-        else:
-            r -= 1
+def column_tops(board: list[int]) -> list[int]:
+    """Return the topmost occupied row of each column (ROWS if empty)."""
+    tops = [ROWS] * COLS
+    for r, bits in enumerate(board):
+        for c in range(COLS):
+            if bits >> c & 1 and tops[c] == ROWS:
+                tops[c] = r
+    return tops
+
+
+def drop_distance(board: list[int], tops: list[int], cells: list[tuple[int, int]]) -> int:
+    """Return how many rows a piece occupying *cells* can fall before landing."""
+    drop = ROWS
+    for r, c in cells:
+        floor = tops[c]
+        if r >= floor:
+            # Tucked under an overhang: scan this column for the next block
+            floor = r + 1
+            while floor < ROWS and not board[floor] >> c & 1:
+                floor += 1
+        if floor - r - 1 < drop:
+            drop = floor - r - 1
+    return drop
+
+
+def clear_lines(board: list[int], colors: bytearray) -> int:
+    if FULL_ROW not in board:
+        return 0
+    # Compact surviving rows towards the bottom in a single pass
+    write = ROWS - 1
+    for read in range(ROWS - 1, -1, -1):
+        bits = board[read]
+        if bits == FULL_ROW:
+            continue
+        if write != read:
+            board[write] = bits
+            colors[write * COLS:(write + 1) * COLS] = colors[read * COLS:(read + 1) * COLS]
+        write -= 1
+    cleared = write + 1
+    for r in range(cleared):
+        board[r] = 0
+    colors[:cleared * COLS] = bytes(cleared * COLS)
     return cleared
 
 
@@ -241,131 +328,227 @@ def clear_lines(board: list[list[str | None]]) -> int:
 # ---------------------------------------------------------------------------
 
 
-def draw_block(surface: pygame.Surface, row: int, col: int, color: tuple, x_offset: int = 0) -> None:
-    """Draw a single block with a slight 3D-ish bevel."""
-    x = col * CELL + x_offset
-    y = row * CELL
-    pygame.draw.rect(surface, color, (x, y, CELL, CELL))
+def _make_block(color: tuple[int, int, int]) -> pygame.Surface:
+    """Render a single block with a slight 3D-ish bevel."""
+    surf = pygame.Surface((CELL, CELL))
+    surf.fill(color)
     # Highlight
     lighter = tuple(min(c + 50, 255) for c in color)
-    pygame.draw.line(surface, lighter, (x, y), (x + CELL - 1, y))
-    pygame.draw.line(surface, lighter, (x, y), (x, y + CELL - 1))
+    pygame.draw.line(surf, lighter, (0, 0), (CELL - 1, 0))
+    pygame.draw.line(surf, lighter, (0, 0), (0, CELL - 1))
     # Shadow
     darker = tuple(max(c - 60, 0) for c in color)
-    pygame.draw.line(surface, darker, (x + CELL - 1, y), (x + CELL - 1, y + CELL - 1))
-    pygame.draw.line(surface, darker, (x, y + CELL - 1), (x + CELL - 1, y + CELL - 1))
-
+    pygame.draw.line(surf, darker, (CELL - 1, 0), (CELL - 1, CELL - 1))
+    pygame.draw.line(surf, darker, (0, CELL - 1), (CELL - 1, CELL - 1))
+    return surf
+
+
+def _make_ghost(color: tuple[int, int, int]) -> pygame.Surface:
+    """Render the dim outline marking one cell of a piece's landing spot."""
+    surf = pygame.Surface((CELL, CELL), pygame.SRCALPHA)
+    ghost_color = tuple(c // 4 for c in color)
+    pygame.draw.rect(surf, ghost_color, (1, 1, CELL - 2, CELL - 2), 1)
+    return surf
+
+
+# One pre-rendered sprite per piece, blitted instead of redrawn every frame
+_BLOCK_SURFS: dict[str, pygame.Surface] = {}
+_GHOST_SURFS: dict[str, pygame.Surface] = {}
+
+
+def init_sprites() -> None:
+    """Build the per-piece sprites in the display's pixel format.
+
+    Every cached surface is converted to the display format so blits are
+    straight copies. Surface.convert() needs a display mode, so this must
+    run after pygame.display.set_mode(); the other caches are built lazily
+    on first draw, which is always later.
+    """
+    for name, color in PIECE_COLORS.items():
+        _BLOCK_SURFS[name] = _make_block(color).convert()
+        _GHOST_SURFS[name] = _make_ghost(color).convert_alpha()
+
+
+_GRID_SURF: pygame.Surface | None = None
+
+
+def _grid_surface() -> pygame.Surface:
+    """Return the transparent grid-line overlay, rendering it once."""
+    global _GRID_SURF
+    if _GRID_SURF is None:
+        surf = pygame.Surface((COLS * CELL + 1, ROWS * CELL + 1), pygame.SRCALPHA).convert_alpha()
+        for r in range(ROWS + 1):
+            pygame.draw.line(surf, GRID_COLOR, (0, r * CELL), (COLS * CELL, r * CELL))
+        for c in range(COLS + 1):
+            pygame.draw.line(surf, GRID_COLOR, (c * CELL, 0), (c * CELL, ROWS * CELL))
+        _GRID_SURF = surf
+    return _GRID_SURF
+
+
+# Locked cells plus grid as last rendered, keyed by the colour grid bytes
+_BOARD_CACHE: tuple[bytes, pygame.Surface] | None = None
+
+
+def draw_board(surface: pygame.Surface, colors: bytearray) -> None:
+    global _BOARD_CACHE
+    key = bytes(colors)
+    if _BOARD_CACHE is None or _BOARD_CACHE[0] != key:
+        grid = _grid_surface()
+        board_surf = pygame.Surface(grid.get_size()).convert()
+        board_surf.fill(BG_COLOR)
+        _blit_many(board_surf, [
+            (_BLOCK_SURFS[ID_TO_NAME[piece_id]], (i % COLS * CELL, i // COLS * CELL))
+            for i, piece_id in enumerate(colors)
+            if piece_id
+        ])
+        board_surf.blit(grid, (0, 0))
+        _BOARD_CACHE = (key, board_surf)
+    surface.blit(_BOARD_CACHE[1], (0, 0))
+
+
+def piece_area(piece: Piece) -> pygame.Rect:
+    """Return the screen area spanned by *piece* and any ghost below it."""
+    cells = piece.cells()
+    top = min(r for r, _ in cells)
+    left = min(c for _, c in cells)
+    right = max(c for _, c in cells)
+    return pygame.Rect(left * CELL, top * CELL, (right - left + 1) * CELL, (ROWS - top) * CELL)
+
+
+def draw_piece(surface: pygame.Surface, board: list[int], tops: list[int], piece: Piece) -> None:
+    """Draw the falling piece above a ghost outline showing where it will land."""
+    cells = piece.cells()
+    drop = drop_distance(board, tops, cells)
+    seq = []
+    if drop:
+        ghost = _GHOST_SURFS[piece.name]
+        seq = [(ghost, (c * CELL, (r + drop) * CELL)) for r, c in cells]
+    block = _BLOCK_SURFS[piece.name]
+    seq += [(block, (c * CELL, r * CELL)) for r, c in cells if r >= 0]
+    _blit_many(surface, seq)
+
+
+_SIDEBAR_STATIC: pygame.Surface | None = None
+
+
+def _sidebar_static() -> pygame.Surface:
+    """Return the sidebar's never-changing labels, rendering them once."""
+    global _SIDEBAR_STATIC
+    if _SIDEBAR_STATIC is None:
+        surf = pygame.Surface((SIDEBAR_W, SCREEN_H), pygame.SRCALPHA).convert_alpha()
+        x0 = 20
+
+        _draw_text(surf, "SCORE", x0, 20, WHITE, scale=2)
+        _draw_text(surf, "LEVEL", x0, 80, WHITE, scale=2)
+        _draw_text(surf, "LINES", x0, 140, WHITE, scale=2)
+        _draw_text(surf, "NEXT", x0, 220, WHITE, scale=2)
+
+        # Controls hint (smaller scale)
+        controls = [
+            "CONTROLS:",
+            "  MOVE",
+            "  ROTATE",
+            "  SOFT DROP",
+            "SPACE HARD DROP",
+            "P PAUSE",
+            "R RESTART",
+        ]
+        for i, line in enumerate(controls):
+            _draw_text(surf, line, x0, 400 + i * 18, DARK_GRAY, scale=1)
+        _SIDEBAR_STATIC = surf
+    return _SIDEBAR_STATIC
 
-def _draw_block_abs(surface: pygame.Surface, px: int, py: int, color: tuple) -> None:
-    """Draw a single block at absolute pixel position."""
-    pygame.draw.rect(surface, color, (px, py, CELL, CELL))
-    lighter = tuple(min(c + 50, 255) for c in color)
-    pygame.draw.line(surface, lighter, (px, py), (px + CELL - 1, py))
-    pygame.draw.line(surface, lighter, (px, py), (px, py + CELL - 1))
-    darker = tuple(max(c - 60, 0) for c in color)
-    pygame.draw.line(surface, darker, (px + CELL - 1, py), (px + CELL - 1, py + CELL - 1))
-    pygame.draw.line(surface, darker, (px, py + CELL - 1), (px + CELL - 1, py + CELL - 1))
 
+# Screen positions of the sidebar's changing fields, shared by draw_sidebar()
+# and the dirty rects main() pushes for them
+_SCORE_POS = (COLS * CELL + 20, 40)
+_LEVEL_POS = (COLS * CELL + 20, 100)
+_LINES_POS = (COLS * CELL + 20, 160)
+_PREVIEW_POS = (COLS * CELL + 30, 250)
+# Height of a sidebar number: 7 px glyph rows at scale 2
+_VALUE_H = 7 * 2
 
-def draw_board(surface: pygame.Surface, board: list[list[str | None]]) -> None:
-    for r in range(ROWS):
-        for c in range(COLS):
-            name = board[r][c]
-            if name:
-                draw_block(surface, r, c, PIECE_COLORS[name])
-
-    # Grid lines
-    for r in range(ROWS + 1):
-        pygame.draw.line(surface, GRID_COLOR, (0, r * CELL), (COLS * CELL, r * CELL))
-    for c in range(COLS + 1):
-        pygame.draw.line(surface, GRID_COLOR, (c * CELL, 0), (c * CELL, ROWS * CELL))
-
-
-def draw_piece(surface: pygame.Surface, piece: Piece) -> None:
-    for r, c in piece.cells:
-        if r >= 0:
-            draw_block(surface, r, c, piece.color)
-
-
-def draw_ghost(surface: pygame.Surface, board: list[list[str | None]], piece: Piece) -> None:
-    """Draw a translucent ghost showing where the piece will land."""
-    ghost = Piece(piece.name)
-    ghost.rot_index = piece.rot_index
-    ghost.row = piece.row
-    ghost.col = piece.col
-    while is_valid(board, [(r + 1, c) for r, c in ghost.cells]):
-        ghost.row += 1
-    if ghost.row == piece.row:
-        return
-    ghost_color = tuple(c // 4 for c in piece.color)
-    for r, c in ghost.cells:
-        if r >= 0:
-            x = c * CELL
-            y = r * CELL
-            pygame.draw.rect(surface, ghost_color, (x + 1, y + 1, CELL - 2, CELL - 2), 1)
 
+# Last rendered number per sidebar slot, re-rendered only when it changes
+_SIDEBAR_VALUES: dict[str, tuple[int, pygame.Surface]] = {}
 
-def draw_sidebar(surface: pygame.Surface, score: int, level: int, lines: int, next_piece: Piece) -> None:
-    x0 = COLS * CELL + 20
 
-    # Score
-    _draw_text(surface, "SCORE", x0, 20, WHITE, scale=2)
-    _draw_text(surface, str(score), x0, 40, WHITE, scale=2)
+def _sidebar_value(slot: str, value: int) -> pygame.Surface:
+    """Return *value* rendered as sidebar text, reusing the previous render."""
+    cached = _SIDEBAR_VALUES.get(slot)
+    if cached is None or cached[0] != value:
+        text = str(value)
+        surf = pygame.Surface((_text_width(text), _VALUE_H), pygame.SRCALPHA).convert_alpha()
+        _draw_text(surf, text, 0, 0, WHITE, scale=2)
+        cached = _SIDEBAR_VALUES[slot] = (value, surf)
+    return cached[1]
 
-    # Level
-    _draw_text(surface, "LEVEL", x0, 80, WHITE, scale=2)
-    _draw_text(surface, str(level), x0, 100, WHITE, scale=2)
 
-    # Lines
-    _draw_text(surface, "LINES", x0, 140, WHITE, scale=2)
-    _draw_text(surface, str(lines), x0, 160, WHITE, scale=2)
+def draw_sidebar(surface: pygame.Surface, score: int, level: int, lines: int, next_piece: Piece) -> None:
+    seq = [
+        (_sidebar_static(), (COLS * CELL, 0)),
+        (_sidebar_value("score", score), _SCORE_POS),
+        (_sidebar_value("level", level), _LEVEL_POS),
+        (_sidebar_value("lines", lines), _LINES_POS),
+    ]
 
     # Next piece
-    _draw_text(surface, "NEXT", x0, 220, WHITE, scale=2)
-
-    preview_cells = SHAPES[next_piece.name][0]
-    color = PIECE_COLORS[next_piece.name]
-    for dr, dc in preview_cells:
-        px = x0 + 10 + dc * CELL
-        py = 250 + dr * CELL
-        _draw_block_abs(surface, px, py, color)
-
-    # Controls hint (smaller scale)
-    controls = [
-        "CONTROLS:",
-        "  MOVE",
-        "  ROTATE",
-        "  SOFT DROP",
-        "SPACE HARD DROP",
-        "P PAUSE",
-        "R RESTART",
+    block = _BLOCK_SURFS[next_piece.name]
+    px, py = _PREVIEW_POS
+    seq += [
+        (block, (px + dc * CELL, py + dr * CELL))
+        for dr, dc in next_piece.rotations[0]
     ]
-    for i, line in enumerate(controls):
-        _draw_text(surface, line, x0, 400 + i * 18, DARK_GRAY, scale=1)
+    _blit_many(surface, seq)
 
 
-def draw_game_over(surface: pygame.Surface) -> None:
-    overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+# Areas of the sidebar showing score, level, lines and the next piece, in
+# the order of the stats tuple main() compares between frames
+_SIDEBAR_STAT_RECTS = (
+    pygame.Rect(_SCORE_POS, (SCREEN_W - _SCORE_POS[0], _VALUE_H)),
+    pygame.Rect(_LEVEL_POS, (SCREEN_W - _LEVEL_POS[0], _VALUE_H)),
+    pygame.Rect(_LINES_POS, (SCREEN_W - _LINES_POS[0], _VALUE_H)),
+    pygame.Rect(_PREVIEW_POS, (4 * CELL, 2 * CELL)),
+)
+
+
+# Pause and game-over screens (dimming plus their text), each built once
+_OVERLAYS: dict[str, pygame.Surface] = {}
+
+
+def _new_overlay() -> pygame.Surface:
+    """Return a fresh translucent full-screen dimming layer."""
+    overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA).convert_alpha()
     overlay.fill((0, 0, 0, 150))
-    surface.blit(overlay, (0, 0))
+    return overlay
+
+
+def draw_game_over(surface: pygame.Surface) -> None:
+    layer = _OVERLAYS.get("game_over")
+    if layer is None:
+        layer = _new_overlay()
 
-    text = "GAME OVER"
-    tw = _text_width(text, scale=4)
-    _draw_text(surface, text, COLS * CELL // 2 - tw // 2, SCREEN_H // 2 - 40, WHITE, scale=4)
+        text = "GAME OVER"
+        tw = _text_width(text, scale=4)
+        _draw_text(layer, text, COLS * CELL // 2 - tw // 2, SCREEN_H // 2 - 40, WHITE, scale=4)
 
-    text2 = "PRESS R TO RESTART"
-    tw2 = _text_width(text2, scale=2)
-    _draw_text(surface, text2, COLS * CELL // 2 - tw2 // 2, SCREEN_H // 2 + 20, WHITE, scale=2)
+        text2 = "PRESS R TO RESTART"
+        tw2 = _text_width(text2, scale=2)
+        _draw_text(layer, text2, COLS * CELL // 2 - tw2 // 2, SCREEN_H // 2 + 20, WHITE, scale=2)
+        _OVERLAYS["game_over"] = layer
+    surface.blit(layer, (0, 0))
 
 
 def draw_pause(surface: pygame.Surface) -> None:
-    overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 150))
-    surface.blit(overlay, (0, 0))
+    layer = _OVERLAYS.get("pause")
+    if layer is None:
+        layer = _new_overlay()
 
-    text = "PAUSED"
-    tw = _text_width(text, scale=4)
-    _draw_text(surface, text, COLS * CELL // 2 - tw // 2, SCREEN_H // 2 - 14, WHITE, scale=4)
+        text = "PAUSED"
+        tw = _text_width(text, scale=4)
+        _draw_text(layer, text, COLS * CELL // 2 - tw // 2, SCREEN_H // 2 - 14, WHITE, scale=4)
+        _OVERLAYS["pause"] = layer
+    surface.blit(layer, (0, 0))
 
 
 # ---------------------------------------------------------------------------
@@ -376,10 +559,14 @@ def draw_pause(surface: pygame.Surface) -> None:
 class Game:
     def __init__(self) -> None:
         self.board = empty_board()
+        self.colors = empty_colors()
+        self.col_tops = column_tops(self.board)
         self.score = 0
         self.lines = 0
         self.level = 1
-        self.bag: list[str] = []
+        # 7-bag drawn back to front and reshuffled in place once empty
+        self.bag = PIECE_NAMES[:]
+        self.bag_left = 0
         self.current = self._new_piece()
         self.next = self._new_piece()
         self.game_over = False
@@ -394,13 +581,14 @@ class Game:
         self.move_dir = 0
 
     def _refill_bag(self) -> None:
-        self.bag = PIECE_NAMES[:]
         random.shuffle(self.bag)
+        self.bag_left = len(self.bag)
 
     def _new_piece(self) -> Piece:
-        if not self.bag:
+        if not self.bag_left:
             self._refill_bag()
-        return Piece(self.bag.pop())
+        self.bag_left -= 1
+        return Piece(self.bag[self.bag_left])
 
     def _calc_interval(self) -> int:
         """Frames-per-drop converted to ms, faster at higher levels."""
@@ -409,33 +597,32 @@ class Game:
     def spawn_next(self) -> None:
         self.current = self.next
         self.next = self._new_piece()
-        if not is_valid(self.board, self.current.cells):
+        piece = self.current
+        if not is_valid_at(self.board, piece.row, piece.col, piece.offsets):
             self.game_over = True
 
     def move(self, dr: int, dc: int) -> bool:
-        new_cells = [(r + dr, c + dc) for r, c in self.current.cells]
-        if is_valid(self.board, new_cells):
-            self.current.row += dr
-            self.current.col += dc
+        piece = self.current
+        if is_valid_at(self.board, piece.row + dr, piece.col + dc, piece.offsets):
+            piece.row += dr
+            piece.col += dc
             return True
         return False
 
     def rotate(self, direction: int = 1) -> None:
-        new_cells = self.current.rotated_cells(direction)
-        if is_valid(self.board, new_cells):
-            self.current.rotate(direction)
-            return
-        # Wall kick: try shifting left/right by 1 or 2
-        for offset in [1, -1, 2, -2]:
-            kicked = [(r, c + offset) for r, c in new_cells]
-            if is_valid(self.board, kicked):
-                self.current.rotate(direction)
-                self.current.col += offset
+        piece = self.current
+        offsets = piece.rotated_offsets(direction)
+        # Rotate in place if possible, else wall kick left/right by 1 or 2
+        for kick in (0, 1, -1, 2, -2):
+            if is_valid_at(self.board, piece.row, piece.col + kick, offsets):
+                piece.rotate(direction)
+                piece.col += kick
                 return
 
     def hard_drop(self) -> None:
-        while self.move(1, 0):
-            self.score += 2
+        drop = drop_distance(self.board, self.col_tops, self.current.cells())
+        self.current.row += drop
+        self.score += 2 * drop
         self._lock_and_clear()
 
     def soft_drop(self) -> bool:
@@ -445,8 +632,15 @@ class Game:
         return False
 
     def _lock_and_clear(self) -> None:
-        lock_piece(self.board, self.current)
-        cleared = clear_lines(self.board)
+        lock_piece(self.board, self.colors, self.current)
+        cleared = clear_lines(self.board, self.colors)
+        if cleared:
+            self.col_tops = column_tops(self.board)
+        else:
+            tops = self.col_tops
+            for r, c in self.current.cells():
+                if r < tops[c]:
+                    tops[c] = r
         self.lines += cleared
         self.score += LINE_SCORES.get(cleared, 0) * self.level
         self.level = self.lines // 10 + 1
@@ -477,12 +671,27 @@ def main() -> None:
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
     pygame.display.set_caption("Tetris")
+    init_sprites()
     clock = pygame.time.Clock()
 
     game = Game()
 
+    # Keys that auto-repeat while held; rotate, hard drop, pause and restart
+    # must fire once per press, so SDL's global key repeat is left disabled
+    repeat_actions = {
+        pygame.K_LEFT: lambda: game.move(0, -1),
+        pygame.K_RIGHT: lambda: game.move(0, 1),
+        pygame.K_DOWN: game.soft_drop,
+    }
+
     # Key repeat state
-    held_keys: dict[int, int] = {}  # key -> elapsed ms
+    held_keys: dict[int, int] = {}  # key -> ms until its next repeat
+
+    # What was last pushed to the display, to update only what changed
+    last_scene: tuple | None = None
+    last_stats: tuple | None = None
+    last_active: tuple | None = None
+    last_area: pygame.Rect | None = None
 
     while True:
         dt = clock.tick(FPS)
@@ -506,15 +715,9 @@ def main() -> None:
                 if game.paused:
                     continue
 
-                if event.key == pygame.K_LEFT:
-                    game.move(0, -1)
-                    held_keys[pygame.K_LEFT] = 0
-                elif event.key == pygame.K_RIGHT:
-                    game.move(0, 1)
-                    held_keys[pygame.K_RIGHT] = 0
-                elif event.key == pygame.K_DOWN:
-                    game.soft_drop()
-                    held_keys[pygame.K_DOWN] = 0
+                if event.key in repeat_actions:
+                    repeat_actions[event.key]()
+                    held_keys[event.key] = game.move_delay
                 elif event.key == pygame.K_UP:
                     game.rotate()
                 elif event.key == pygame.K_SPACE:
@@ -523,30 +726,35 @@ def main() -> None:
             if event.type == pygame.KEYUP:
                 held_keys.pop(event.key, None)
 
+            if event.type == pygame.WINDOWEXPOSED:
+                last_scene = None
+
         # --- Auto-repeat for held keys ---
-        if not game.game_over and not game.paused:
-            for key in [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_DOWN]:
-                if key in held_keys:
-                    held_keys[key] += dt
-                    if held_keys[key] >= game.move_delay:
-                        repeat_elapsed = held_keys[key] - game.move_delay
-                        if repeat_elapsed % game.move_repeat < dt:
-                            if key == pygame.K_LEFT:
-                                game.move(0, -1)
-                            elif key == pygame.K_RIGHT:
-                                game.move(0, 1)
-                            elif key == pygame.K_DOWN:
-                                game.soft_drop()
+        if held_keys and not game.game_over and not game.paused:
+            for key, wait in held_keys.items():
+                # Fire once for every repeat deadline passed this frame
+                wait -= dt
+                while wait <= 0:
+                    repeat_actions[key]()
+                    wait += game.move_repeat
+                held_keys[key] = wait
 
         # --- Update ---
         game.tick(dt)
 
+        # --- Skip frames where nothing visible changed ---
+        cur = game.current
+        scene = (bytes(game.colors), game.paused, game.game_over)
+        stats = (game.score, game.level, game.lines, game.next.name)
+        active = None if game.game_over else (cur.name, cur.rot_index, cur.row, cur.col)
+        if scene == last_scene and stats == last_stats and active == last_active:
+            continue
+
         # --- Draw ---
         screen.fill(BG_COLOR)
-        draw_board(screen, game.board)
+        draw_board(screen, game.colors)
         if not game.game_over:
-            draw_ghost(screen, game.board, game.current)
-            draw_piece(screen, game.current)
+            draw_piece(screen, game.board, game.col_tops, cur)
         draw_sidebar(screen, game.score, game.level, game.lines, game.next)
 
         if game.game_over:
@@ -554,7 +762,22 @@ def main() -> None:
         elif game.paused:
             draw_pause(screen)
 
-        pygame.display.flip()
+        # --- Present ---
+        area = None if game.game_over else piece_area(cur)
+        if scene != last_scene:
+            # Locks, line clears and overlays change most of the screen
+            pygame.display.flip()
+        else:
+            dirty = []
+            if active != last_active:
+                dirty += [last_area, area]
+            dirty += [
+                rect
+                for rect, value, last in zip(_SIDEBAR_STAT_RECTS, stats, last_stats)
+                if value != last
+            ]
+            pygame.display.update(dirty)
+        last_scene, last_stats, last_active, last_area = scene, stats, active, area
 
 
 if __name__ == "__main__":